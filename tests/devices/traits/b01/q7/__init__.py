@@ -2,7 +2,7 @@ import json
 from typing import Any
 
 from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad
+from Crypto.Util.Padding import pad, unpad
 
 from roborock.devices.traits.b01.q7 import Q7PropertiesApi
 from roborock.roborock_message import RoborockMessage, RoborockMessageProtocol
@@ -49,3 +49,9 @@ class B01MessageBuilder:
             version=b"B01",
             seq=self.seq,
         )
+
+
+def decode_request_payload(message: RoborockMessage) -> dict[str, Any]:
+    """Decode the JSON payload of a B01 RPC request published by the API."""
+    assert message.payload is not None
+    return json.loads(unpad(message.payload, AES.block_size))
@@ -1,9 +1,6 @@
-import json
 from typing import Any, cast
 
 import pytest
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import unpad
 
 from roborock.data.b01_q7 import (
     CleanTaskTypeMapping,
@@ -20,7 +17,9 @@ from roborock.protocols.b01_q7_protocol import B01_VERSION, Q7RequestMessage
 from roborock.roborock_message import RoborockB01Props, RoborockMessageProtocol
 from tests.fixtures.channel_fixtures import FakeChannel
 
-from . import B01MessageBuilder
+from . import B01MessageBuilder, decode_request_payload
+
+QUERY_VALUES_PARAMS = {"property": [RoborockB01Props.STATUS, RoborockB01Props.WIND]}
 
 
 async def test_q7_api_query_values(
@@ -52,13 +51,13 @@ async def test_q7_api_query_values(
     assert message.version == B01_VERSION
 
     assert message.payload is not None
-    payload_data = json.loads(unpad(message.payload, AES.block_size))
+    payload_data = decode_request_payload(message)
     assert "dps" in payload_data
     assert "10000" in payload_data["dps"]
     inner = payload_data["dps"]["10000"]
     assert inner["method"] == "prop.get"
     assert inner["msgId"] == str(message_builder.msg_id)
-    assert inner["params"] == {"property": [RoborockB01Props.STATUS, RoborockB01Props.WIND]}
+    assert inner["params"] == QUERY_VALUES_PARAMS
 
 
 @pytest.mark.parametrize(
@@ -133,7 +132,7 @@ async def test_q7_api_set_fan_speed(
 
     assert len(fake_channel.published_messages) == 1
     message = fake_channel.published_messages[0]
-    payload_data = json.loads(unpad(message.payload, AES.block_size))
+    payload_data = decode_request_payload(message)
     assert payload_data["dps"]["10000"]["method"] == "prop.set"
     assert payload_data["dps"]["10000"]["params"] == {RoborockB01Props.WIND: SCWindMapping.STRONG.code}
 
@@ -147,7 +146,7 @@ async def test_q7_api_set_water_level(
 
     assert len(fake_channel.published_messages) == 1
     message = fake_channel.published_messages[0]
-    payload_data = json.loads(unpad(message.payload, AES.block_size))
+    payload_data = decode_request_payload(message)
     assert payload_data["dps"]["10000"]["method"] == "prop.set"
     assert payload_data["dps"]["10000"]["params"] == {RoborockB01Props.WATER: WaterLevelMapping.HIGH.code}
 
@@ -165,7 +164,7 @@ async def test_q7_api_set_volume(
 
     assert len(fake_channel.published_messages) == 1
     message = fake_channel.published_messages[0]
-    payload_data = json.loads(unpad(message.payload, AES.block_size))
+    payload_data = decode_request_payload(message)
     assert payload_data["dps"]["10000"]["method"] == "prop.set"
     assert payload_data["dps"]["10000"]["params"] == {RoborockB01Props.VOLUME: volume}
 
@@ -187,7 +186,7 @@ async def test_q7_api_set_child_lock(
 
     assert len(fake_channel.published_messages) == 1
     message = fake_channel.published_messages[0]
-    payload_data = json.loads(unpad(message.payload, AES.block_size))
+    payload_data = decode_request_payload(message)
     assert payload_data["dps"]["10000"]["method"] == "prop.set"
     assert payload_data["dps"]["10000"]["params"] == {RoborockB01Props.CHILD_LOCK: expected_code}
 
@@ -205,7 +204,7 @@ async def test_q7_api_set_do_not_disturb(
     await q7_api.set_do_not_disturb(enabled, 1200, 420)
 
     message = fake_channel.published_messages[0]
-    payload_data = json.loads(unpad(message.payload, AES.block_size))
+    payload_data = decode_request_payload(message)
     assert payload_data["dps"]["10000"]["method"] == "service.set_quiet_time"
     assert payload_data["dps"]["10000"]["params"] == {
         "is_open": expected_is_open,
@@ -252,7 +251,7 @@ async def test_q7_api_set_mode(
 
     assert len(fake_channel.published_messages) == 1
     message = fake_channel.published_messages[0]
-    payload_data = json.loads(unpad(message.payload, AES.block_size))
+    payload_data = decode_request_payload(message)
     assert payload_data["dps"]["10000"]["method"] == "prop.set"
     assert payload_data["dps"]["10000"]["params"] == {RoborockB01Props.MODE: expected_code}
 
@@ -266,7 +265,7 @@ async def test_q7_api_start_clean(
 
     assert len(fake_channel.published_messages) == 1
     message = fake_channel.published_messages[0]
-    payload_data = json.loads(unpad(message.payload, AES.block_size))
+    payload_data = decode_request_payload(message)
     assert payload_data["dps"]["10000"]["method"] == "service.set_room_clean"
     assert payload_data["dps"]["10000"]["params"] == {
         "clean_type": CleanTaskTypeMapping.ALL.code,
@@ -284,7 +283,7 @@ async def test_q7_api_pause_clean(
 
     assert len(fake_channel.published_messages) == 1
     message = fake_channel.published_messages[0]
-    payload_data = json.loads(unpad(message.payload, AES.block_size))
+    payload_data = decode_request_payload(message)
     assert payload_data["dps"]["10000"]["method"] == "service.set_room_clean"
     assert payload_data["dps"]["10000"]["params"] == {
         "clean_type": CleanTaskTypeMapping.ALL.code,
@@ -302,7 +301,7 @@ async def test_q7_api_stop_clean(
 
     assert len(fake_channel.published_messages) == 1
     message = fake_channel.published_messages[0]
-    payload_data = json.loads(unpad(message.payload, AES.block_size))
+    payload_data = decode_request_payload(message)
     assert payload_data["dps"]["10000"]["method"] == "service.set_room_clean"
     assert payload_data["dps"]["10000"]["params"] == {
         "clean_type": CleanTaskTypeMapping.ALL.code,
@@ -320,7 +319,7 @@ async def test_q7_api_return_to_dock(
 
     assert len(fake_channel.published_messages) == 1
     message = fake_channel.published_messages[0]
-    payload_data = json.loads(unpad(message.payload, AES.block_size))
+    payload_data = decode_request_payload(message)
     assert payload_data["dps"]["10000"]["method"] == "service.start_recharge"
     assert payload_data["dps"]["10000"]["params"] == {}
 
@@ -332,7 +331,7 @@ async def test_q7_api_find_me(q7_api: Q7PropertiesApi, fake_channel: FakeChannel
 
     assert len(fake_channel.published_messages) == 1
     message = fake_channel.published_messages[0]
-    payload_data = json.loads(unpad(message.payload, AES.block_size))
+    payload_data = decode_request_payload(message)
     assert payload_data["dps"]["10000"]["method"] == "service.find_device"
     assert payload_data["dps"]["10000"]["params"] == {}
 
@@ -346,7 +345,7 @@ async def test_q7_api_clean_segments(
 
     assert len(fake_channel.published_messages) == 1
     message = fake_channel.published_messages[0]
-    payload_data = json.loads(unpad(message.payload, AES.block_size))
+    payload_data = decode_request_payload(message)
     assert payload_data["dps"]["10000"]["method"] == "service.set_room_clean"
     assert payload_data["dps"]["10000"]["params"] == {
         "clean_type": CleanTaskTypeMapping.ROOM.code,
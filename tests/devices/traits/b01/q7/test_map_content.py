@@ -1,9 +1,6 @@
-import json
 from unittest.mock import patch
 
 import pytest
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import unpad
 from vacuum_map_parser_base.map_data import MapData
 
 from roborock.devices.traits.b01.q7 import Q7PropertiesApi
@@ -11,7 +8,7 @@ from roborock.exceptions import RoborockException
 from roborock.map.b01_map_parser import ParsedMapData
 from tests.fixtures.channel_fixtures import FakeChannel
 
-from . import B01MessageBuilder
+from . import B01MessageBuilder, decode_request_payload
 
 
 async def test_q7_map_content_refresh_populates_cached_values(
@@ -54,11 +51,11 @@ async def test_q7_map_content_refresh_populates_cached_values(
 
     assert len(fake_channel.published_messages) == 2
     first = fake_channel.published_messages[0]
-    first_payload = json.loads(unpad(first.payload, AES.block_size))
+    first_payload = decode_request_payload(first)
     assert first_payload["dps"]["10000"]["method"] == "service.get_map_list"
 
     second = fake_channel.published_messages[1]
-    second_payload = json.loads(unpad(second.payload, AES.block_size))
+    second_payload = decode_request_payload(second)
     assert second_payload["dps"]["10000"]["method"] == "service.upload_by_mapid"
     assert second_payload["dps"]["10000"]["params"] == {"map_id": 1772093512}
 
@@ -93,7 +90,7 @@ async def test_q7_map_content_refresh_falls_back_to_first_map(
         await q7_api.map_content.refresh()
 
     second = fake_channel.published_messages[1]
-    second_payload = json.loads(unpad(second.payload, AES.block_size))
+    second_payload = decode_request_payload(second)
     assert second_payload["dps"]["10000"]["params"] == {"map_id": 111}
 
 
@@ -1 +1 @@
-pytest_plugins = ["tests.devices.traits.v1.fixtures"]
+"""Tests for V1 device traits."""
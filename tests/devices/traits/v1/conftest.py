@@ -1,6 +1,8 @@
 """Fixtures for V1 trait tests."""
 
+import functools
 from copy import deepcopy
+from typing import Any
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -16,34 +18,48 @@ HOME_DATA = HomeData.from_dict(mock_data.HOME_DATA_RAW)
 STATUS = S7MaxVStatus.from_dict(mock_data.STATUS)
 
 
-@pytest.fixture(autouse=True, name="channel")
-def device_channel_fixture() -> AsyncMock:
+@functools.lru_cache(maxsize=8)
+def _status_with_dock(dock_type_code: RoborockDockTypeCode | None) -> dict[str, Any]:
+    """Return the raw status payload reporting the given dock type.
+
+    The result is shared between tests and must not be modified.
+    """
+    return mock_data.STATUS | {"dock_type": dock_type_code}
+
+
+@pytest.fixture(name="channel")
+def device_channel_fixture() -> Mock:
     """Fixture to set up the channel for tests."""
-    return AsyncMock()
+    return Mock(subscribe=AsyncMock())
 
 
-@pytest.fixture(autouse=True, name="mock_rpc_channel")
-def rpc_channel_fixture() -> AsyncMock:
+@pytest.fixture(name="mock_rpc_channel")
+def rpc_channel_fixture() -> Mock:
     """Fixture to set up the channel for tests."""
-    return AsyncMock()
+    return Mock(send_command=AsyncMock())
 
 
-@pytest.fixture(autouse=True, name="mock_mqtt_rpc_channel")
-def mqtt_rpc_channel_fixture() -> AsyncMock:
+@pytest.fixture(name="mock_mqtt_rpc_channel")
+def mqtt_rpc_channel_fixture() -> Mock:
     """Fixture to set up the channel for tests."""
-    return AsyncMock()
+    return Mock(send_command=AsyncMock())
 
 
-@pytest.fixture(autouse=True, name="mock_map_rpc_channel")
-def map_rpc_channel_fixture() -> AsyncMock:
+@pytest.fixture(name="mock_map_rpc_channel")
+def map_rpc_channel_fixture() -> Mock:
     """Fixture to set up the channel for tests."""
-    return AsyncMock()
+    return Mock(send_command=AsyncMock())
 
 
-@pytest.fixture(autouse=True, name="web_api_client")
-def web_api_client_fixture() -> AsyncMock:
+@pytest.fixture(name="web_api_client")
+def web_api_client_fixture() -> Mock:
     """Fixture to set up the web API client for tests."""
-    return AsyncMock()
+    return Mock(
+        get_rooms=AsyncMock(),
+        get_shared_device_rooms=AsyncMock(),
+        get_routines=AsyncMock(),
+        execute_routine=AsyncMock(),
+    )
 
 
 @pytest.fixture(name="trait_home_data")
@@ -52,13 +68,13 @@ def trait_home_data_fixture(request: pytest.FixtureRequest) -> HomeData:
     return deepcopy(getattr(request, "param", HOME_DATA))
 
 
-@pytest.fixture(autouse=True, name="roborock_cache")
+@pytest.fixture(name="roborock_cache")
 def roborock_cache_fixture() -> Cache:
     """Fixture to provide a NoCache instance for tests."""
     return InMemoryCache()
 
 
-@pytest.fixture(autouse=True, name="device_cache")
+@pytest.fixture(name="device_cache")
 def device_cache_fixture(roborock_cache: Cache, trait_home_data: HomeData) -> DeviceCache:
     """Fixture to provide a DeviceCache instance for tests."""
     return DeviceCache(trait_home_data.get_all_devices()[0].duid, roborock_cache)
@@ -71,25 +87,26 @@ def device_info_fixture(trait_home_data: HomeData) -> HomeDataDevice:
 
 
 @pytest.fixture(name="products")
-def products_fixture() -> list[HomeDataProduct]:
-    """Fixture to provide a Product instance for tests."""
-    return [HomeDataProduct.from_dict(product) for product in mock_data.PRODUCTS.values()]
+def products_fixture() -> dict[str, HomeDataProduct]:
+    """Fixture to provide the known products keyed by product id."""
+    return mock_data.PRODUCTS_BY_ID
 
 
-@pytest.fixture(autouse=True, name="device")
+@pytest.fixture(name="device")
 def device_fixture(
-    channel: AsyncMock,
-    mock_rpc_channel: AsyncMock,
-    mock_mqtt_rpc_channel: AsyncMock,
-    mock_map_rpc_channel: AsyncMock,
-    web_api_client: AsyncMock,
+    channel: Mock,
+    mock_rpc_channel: Mock,
+    mock_mqtt_rpc_channel: Mock,
+    mock_map_rpc_channel: Mock,
+    web_api_client: Mock,
     device_cache: DeviceCache,
     device_info: HomeDataDevice,
     trait_home_data: HomeData,
-    products: list[HomeDataProduct],
+    products: dict[str, HomeDataProduct],
 ) -> RoborockDevice:
     """Fixture to set up the device for tests."""
-    product = next(filter(lambda product: product.id == device_info.product_id, products))
+    if (product := products.get(device_info.product_id)) is None:
+        raise ValueError(f"No product found for product id {device_info.product_id}")
     return RoborockDevice(
         device_info=device_info,
         product=product,
@@ -109,29 +126,33 @@ def device_fixture(
     )
 
 
-@pytest.fixture(name="dock_type_code", autouse=True)
-def dock_type_code_fixture(request: pytest.FixtureRequest) -> RoborockDockTypeCode | None:
+@pytest.fixture(name="v1_properties")
+def v1_properties_fixture(device: RoborockDevice) -> v1.PropertiesApi:
+    """Fixture to provide the V1 traits of the device under test."""
+    assert device.v1_properties is not None
+    return device.v1_properties
+
+
+@pytest.fixture(name="dock_type_code")
+def dock_type_code_fixture() -> RoborockDockTypeCode | None:
     """Fixture to provide the dock type code for parameterized tests."""
     return RoborockDockTypeCode.s7_max_ultra_dock
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 async def discover_features_fixture(
     device: RoborockDevice,
-    mock_rpc_channel: AsyncMock,
+    v1_properties: v1.PropertiesApi,
+    mock_rpc_channel: Mock,
     dock_type_code: RoborockDockTypeCode | None,
 ) -> None:
     """Fixture to handle device feature discovery."""
-    assert device.v1_properties
     mock_rpc_channel.send_command.side_effect = [
         [mock_data.APP_GET_INIT_STATUS],
-        {
-            **mock_data.STATUS,
-            "dock_type": dock_type_code,
-        },
+        _status_with_dock(dock_type_code),
     ]
     # Connecting triggers device discovery
     await device.connect()
-    assert device.v1_properties.status.dock_type == dock_type_code
-    mock_rpc_channel.send_command.reset_mock()
-    mock_rpc_channel.send_command.side_effect = None
+    assert v1_properties.status.dock_type == dock_type_code
+    # Give the test a fresh mock rather than one with the discovery calls recorded
+    mock_rpc_channel.send_command = AsyncMock()
@@ -1,11 +1,11 @@
 """Tests for the CleanSummary class."""
 
-from unittest.mock import AsyncMock, call
+from unittest.mock import Mock, call
 
 import pytest
 
 from roborock.data import CleanSummary
-from roborock.devices.device import RoborockDevice
+from roborock.devices.traits.v1 import PropertiesApi
 from roborock.devices.traits.v1.clean_summary import CleanSummaryTrait
 from roborock.exceptions import RoborockException
 from roborock.roborock_typing import RoborockCommand
@@ -55,10 +55,9 @@ CLEAN_RECORD_DATA = [
 
 
 @pytest.fixture
-def clean_summary_trait(device: RoborockDevice) -> CleanSummaryTrait:
+def clean_summary_trait(v1_properties: PropertiesApi) -> CleanSummaryTrait:
     """Create a DoNotDisturbTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    return device.v1_properties.clean_summary
+    return v1_properties.clean_summary
 
 
 @pytest.fixture
@@ -71,7 +70,7 @@ def sample_clean_summary() -> CleanSummary:
 
 
 async def test_get_clean_summary_success(
-    clean_summary_trait: CleanSummaryTrait, mock_rpc_channel: AsyncMock, sample_clean_summary: CleanSummary
+    clean_summary_trait: CleanSummaryTrait, mock_rpc_channel: Mock, sample_clean_summary: CleanSummary
 ) -> None:
     """Test successfully getting clean summary."""
     # Setup mock to return the sample clean summary
@@ -98,7 +97,7 @@ async def test_get_clean_summary_success(
 
 
 async def test_get_clean_summary_clean_time_only(
-    clean_summary_trait: CleanSummaryTrait, mock_rpc_channel: AsyncMock, sample_clean_summary: CleanSummary
+    clean_summary_trait: CleanSummaryTrait, mock_rpc_channel: Mock, sample_clean_summary: CleanSummary
 ) -> None:
     """Test successfully getting clean summary where the response only has the clean time."""
 
@@ -119,7 +118,7 @@ async def test_get_clean_summary_clean_time_only(
 
 
 async def test_get_clean_summary_propagates_exception(
-    clean_summary_trait: CleanSummaryTrait, mock_rpc_channel: AsyncMock
+    clean_summary_trait: CleanSummaryTrait, mock_rpc_channel: Mock
 ) -> None:
     """Test that exceptions from RPC channel are propagated in get_clean_summary."""
 
@@ -133,7 +132,7 @@ async def test_get_clean_summary_propagates_exception(
 
 async def test_get_clean_record_success(
     clean_summary_trait: CleanSummaryTrait,
-    mock_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
 ) -> None:
     """Test successfully getting the last clean record."""
     # Setup mock to return the sample clean summary and clean record
@@ -164,7 +163,7 @@ async def test_get_clean_record_success(
 
 async def test_get_clean_record_dict_response(
     clean_summary_trait: CleanSummaryTrait,
-    mock_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
 ) -> None:
     """Test successfully getting the last clean record as a dictionary."""
     # Setup mock to return the sample clean summary and clean record
@@ -197,9 +196,7 @@ async def test_get_clean_record_dict_response(
     )
 
 
-async def test_get_clean_summary_no_records(
-    clean_summary_trait: CleanSummaryTrait, mock_rpc_channel: AsyncMock
-) -> None:
+async def test_get_clean_summary_no_records(clean_summary_trait: CleanSummaryTrait, mock_rpc_channel: Mock) -> None:
     """Test successfully getting clean summary with no records."""
     # Setup mock to return the sample clean summary with no records
     mock_rpc_channel.send_command.return_value = [
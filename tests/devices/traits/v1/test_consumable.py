@@ -1,10 +1,10 @@
 """Tests for the DoNotDisturbTrait class."""
 
-from unittest.mock import AsyncMock, call
+from unittest.mock import Mock, call
 
 import pytest
 
-from roborock.devices.device import RoborockDevice
+from roborock.devices.traits.v1 import PropertiesApi
 from roborock.devices.traits.v1.consumeable import ConsumableAttribute, ConsumableTrait
 from roborock.roborock_typing import RoborockCommand
 
@@ -20,13 +20,12 @@ CONSUMABLE_DATA = [
 
 
 @pytest.fixture
-def consumable_trait(device: RoborockDevice) -> ConsumableTrait:
+def consumable_trait(v1_properties: PropertiesApi) -> ConsumableTrait:
     """Create a ConsumableTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    return device.v1_properties.consumables
+    return v1_properties.consumables
 
 
-async def test_get_consumable_data_success(consumable_trait: ConsumableTrait, mock_rpc_channel: AsyncMock) -> None:
+async def test_get_consumable_data_success(consumable_trait: ConsumableTrait, mock_rpc_channel: Mock) -> None:
     """Test successfully getting consumable data."""
     # Setup mock to return the sample consumable data
     mock_rpc_channel.send_command.return_value = CONSUMABLE_DATA
@@ -57,7 +56,7 @@ async def test_get_consumable_data_success(consumable_trait: ConsumableTrait, mo
 )
 async def test_reset_consumable_data(
     consumable_trait: ConsumableTrait,
-    mock_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
     consumable: ConsumableAttribute,
     reset_param: str,
 ) -> None:
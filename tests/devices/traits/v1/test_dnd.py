@@ -1,22 +1,20 @@
 """Tests for the DoNotDisturbTrait class."""
 
-from unittest.mock import AsyncMock, call
+from unittest.mock import Mock, call
 
 import pytest
 
 from roborock.data import DnDTimer
-from roborock.devices.device import RoborockDevice
+from roborock.devices.traits.v1 import PropertiesApi
 from roborock.devices.traits.v1.do_not_disturb import DoNotDisturbTrait
 from roborock.exceptions import RoborockException
 from roborock.roborock_typing import RoborockCommand
 
 
 @pytest.fixture
-async def dnd_trait(device: RoborockDevice) -> DoNotDisturbTrait:
+async def dnd_trait(v1_properties: PropertiesApi) -> DoNotDisturbTrait:
     """Create a DoNotDisturbTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    assert device.v1_properties.dnd
-    return device.v1_properties.dnd
+    return v1_properties.dnd
 
 
 @pytest.fixture
@@ -32,7 +30,7 @@ def sample_dnd_timer() -> DnDTimer:
 
 
 async def test_get_dnd_timer_success(
-    dnd_trait: DoNotDisturbTrait, mock_rpc_channel: AsyncMock, sample_dnd_timer: DnDTimer
+    dnd_trait: DoNotDisturbTrait, mock_rpc_channel: Mock, sample_dnd_timer: DnDTimer
 ) -> None:
     """Test successfully getting DnD timer settings."""
     # Setup mock to return the sample DnD timer
@@ -53,7 +51,7 @@ async def test_get_dnd_timer_success(
     mock_rpc_channel.send_command.assert_called_once_with(RoborockCommand.GET_DND_TIMER)
 
 
-async def test_get_dnd_timer_disabled(dnd_trait: DoNotDisturbTrait, mock_rpc_channel: AsyncMock) -> None:
+async def test_get_dnd_timer_disabled(dnd_trait: DoNotDisturbTrait, mock_rpc_channel: Mock) -> None:
     """Test getting DnD timer when it's disabled."""
     disabled_timer = DnDTimer(
         start_hour=22,
@@ -72,7 +70,7 @@ async def test_get_dnd_timer_disabled(dnd_trait: DoNotDisturbTrait, mock_rpc_cha
 
 
 async def test_set_dnd_timer_success(
-    dnd_trait: DoNotDisturbTrait, mock_rpc_channel: AsyncMock, sample_dnd_timer: DnDTimer
+    dnd_trait: DoNotDisturbTrait, mock_rpc_channel: Mock, sample_dnd_timer: DnDTimer
 ) -> None:
     """Test successfully setting DnD timer settings."""
     mock_rpc_channel.send_command.side_effect = [
@@ -108,7 +106,7 @@ async def test_set_dnd_timer_success(
     assert dnd_trait.end_minute == 0
 
 
-async def test_clear_dnd_timer_success(dnd_trait: DoNotDisturbTrait, mock_rpc_channel: AsyncMock) -> None:
+async def test_clear_dnd_timer_success(dnd_trait: DoNotDisturbTrait, mock_rpc_channel: Mock) -> None:
     """Test successfully clearing DnD timer settings."""
     mock_rpc_channel.send_command.side_effect = [
         # Response for CLOSE_DND_TIMER
@@ -141,38 +139,16 @@ async def test_clear_dnd_timer_success(dnd_trait: DoNotDisturbTrait, mock_rpc_ch
     assert dnd_trait.end_minute == 0
 
 
-async def test_get_dnd_timer_propagates_exception(dnd_trait: DoNotDisturbTrait, mock_rpc_channel: AsyncMock) -> None:
-    """Test that exceptions from RPC channel are propagated in get_dnd_timer."""
-
-    # Setup mock to raise an exception
-    mock_rpc_channel.send_command.side_effect = RoborockException("Communication error")
-
-    # Verify the exception is propagated
-    with pytest.raises(RoborockException, match="Communication error"):
-        await dnd_trait.refresh()
-
-
-async def test_set_dnd_timer_propagates_exception(
-    dnd_trait: DoNotDisturbTrait, mock_rpc_channel: AsyncMock, sample_dnd_timer: DnDTimer
+@pytest.mark.parametrize("method", ["refresh", "set_dnd_timer", "clear_dnd_timer"])
+async def test_dnd_propagates_exception(
+    dnd_trait: DoNotDisturbTrait, mock_rpc_channel: Mock, sample_dnd_timer: DnDTimer, method: str
 ) -> None:
-    """Test that exceptions from RPC channel are propagated in set_dnd_timer."""
-    from roborock.exceptions import RoborockException
-
-    # Setup mock to raise an exception
-    mock_rpc_channel.send_command.side_effect = RoborockException("Communication error")
-
-    # Verify the exception is propagated
-    with pytest.raises(RoborockException, match="Communication error"):
-        await dnd_trait.set_dnd_timer(sample_dnd_timer)
-
-
-async def test_clear_dnd_timer_propagates_exception(dnd_trait: DoNotDisturbTrait, mock_rpc_channel: AsyncMock) -> None:
-    """Test that exceptions from RPC channel are propagated in clear_dnd_timer."""
-    from roborock.exceptions import RoborockException
+    """Test that exceptions from RPC channel are propagated by each DnD method."""
+    args = (sample_dnd_timer,) if method == "set_dnd_timer" else ()
 
     # Setup mock to raise an exception
     mock_rpc_channel.send_command.side_effect = RoborockException("Communication error")
 
     # Verify the exception is propagated
     with pytest.raises(RoborockException, match="Communication error"):
-        await dnd_trait.clear_dnd_timer()
+        await getattr(dnd_trait, method)(*args)
@@ -1,11 +1,11 @@
 """Tests for the DustCollectionModeTrait class."""
 
-from unittest.mock import AsyncMock, call
+from unittest.mock import Mock
 
 import pytest
 
 from roborock.data import RoborockDockDustCollectionModeCode, RoborockDockTypeCode
-from roborock.devices.device import RoborockDevice
+from roborock.devices.traits.v1 import PropertiesApi
 from roborock.devices.traits.v1.dust_collection_mode import DustCollectionModeTrait
 from roborock.roborock_typing import RoborockCommand
 
@@ -14,50 +14,50 @@ DUST_COLLECTION_MODE_DATA = [{"mode": 2}]
 
 @pytest.fixture(name="dust_collection_mode")
 def dust_collection_mode_trait(
-    device: RoborockDevice,
+    v1_properties: PropertiesApi,
     discover_features_fixture: None,
 ) -> DustCollectionModeTrait | None:
     """Create a DustCollectionModeTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    return device.v1_properties.dust_collection_mode
+    return v1_properties.dust_collection_mode
 
 
 @pytest.mark.parametrize(
-    ("dock_type_code"),
+    ("dock_type_code", "expected"),
     [
-        (RoborockDockTypeCode.s7_max_ultra_dock),
-        (RoborockDockTypeCode.s8_dock),
-        (RoborockDockTypeCode.p10_dock),
-        (RoborockDockTypeCode.qrevo_s_dock),
-        (RoborockDockTypeCode.qrevo_s5v_dock),
-        (RoborockDockTypeCode.saros_20_dock),
+        (RoborockDockTypeCode.s7_max_ultra_dock, True),
+        (RoborockDockTypeCode.s8_dock, True),
+        (RoborockDockTypeCode.p10_dock, True),
+        (RoborockDockTypeCode.qrevo_s_dock, True),
+        (RoborockDockTypeCode.qrevo_s5v_dock, True),
+        (RoborockDockTypeCode.saros_20_dock, True),
+        (RoborockDockTypeCode.no_dock, False),
     ],
 )
+def test_dust_collection_mode_supported_docks(dock_type_code: RoborockDockTypeCode, expected: bool) -> None:
+    """Test which dock types support the dust collection mode trait."""
+    assert DustCollectionModeTrait.requires_dock_type(dock_type_code) is expected
+
+
+@pytest.mark.parametrize(("dock_type_code"), [(RoborockDockTypeCode.s8_dock)])
 async def test_dust_collection_mode_available(
     dust_collection_mode: DustCollectionModeTrait | None,
-    mock_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
     dock_type_code: RoborockDockTypeCode,
 ) -> None:
     """Test successfully refreshing the dust collection mode."""
     assert dust_collection_mode is not None
 
-    mock_rpc_channel.send_command.side_effect = [
-        DUST_COLLECTION_MODE_DATA,
-    ]
+    mock_rpc_channel.send_command.return_value = DUST_COLLECTION_MODE_DATA
 
     await dust_collection_mode.refresh()
 
-    mock_rpc_channel.send_command.assert_has_calls(
-        [
-            call(RoborockCommand.GET_DUST_COLLECTION_MODE),
-        ]
-    )
+    mock_rpc_channel.send_command.assert_called_once_with(RoborockCommand.GET_DUST_COLLECTION_MODE)
 
     assert dust_collection_mode.mode == RoborockDockDustCollectionModeCode.balanced
 
 
 @pytest.mark.parametrize(("dock_type_code"), [(RoborockDockTypeCode.no_dock)])
-async def test_unsupported_dust_collection_mode(
+def test_unsupported_dust_collection_mode(
     dust_collection_mode: DustCollectionModeTrait | None,
     dock_type_code: RoborockDockTypeCode,
 ) -> None:
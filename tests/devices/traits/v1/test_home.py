@@ -1,16 +1,20 @@
 """Tests for the Home related functionality."""
 
+import asyncio
 import base64
 from collections.abc import Iterator
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from vacuum_map_parser_base.map_data import MapData
 
 from roborock.data.containers import CombinedMapInfo, HomeDataRoom, NamedRoomMapping
 from roborock.data.v1.v1_code_mappings import RoborockStateCode
 from roborock.data.v1.v1_containers import MultiMapsListMapInfo, MultiMapsListRoom
 from roborock.devices.cache import DeviceCache, DeviceCacheData, InMemoryCache
-from roborock.devices.device import RoborockDevice
+from roborock.devices.traits.v1 import PropertiesApi
+from roborock.devices.traits.v1.common import merge_trait_values
 from roborock.devices.traits.v1.home import HomeTrait
 from roborock.devices.traits.v1.map_content import MapContentTrait
 from roborock.devices.traits.v1.maps import MapsTrait
@@ -64,17 +68,17 @@ MULTI_MAP_LIST_SINGLE_MAP_DATA = [
 ROOM_MAPPING_DATA_MAP_0 = [[16, "2362048"], [17, "2362044"]]
 ROOM_MAPPING_DATA_MAP_123 = [[18, "2362041"], [19, "2362042"]]
 
-UPDATED_STATUS_MAP_0 = {
-    **mock_data.STATUS,
+UPDATED_STATUS_MAP_0 = mock_data.STATUS | {
     "map_status": 0 * 4 + 3,  # Set current map to 0
 }
 
-UPDATED_STATUS_MAP_123 = {
-    **mock_data.STATUS,
+UPDATED_STATUS_MAP_123 = mock_data.STATUS | {
     "map_status": 123 * 4 + 3,  # Set current map to 123
 }
 MAP_BYTES_RESPONSE_1 = b"<map bytes 1>"
 MAP_BYTES_RESPONSE_2 = b"<map bytes 2>"
+MAP_BYTES_RESPONSE_1_B64 = base64.b64encode(MAP_BYTES_RESPONSE_1).decode()
+MAP_BYTES_RESPONSE_2_B64 = base64.b64encode(MAP_BYTES_RESPONSE_2).decode()
 TEST_IMAGE_CONTENT_1 = b"<image bytes 1>"
 TEST_IMAGE_CONTENT_2 = b"<image bytes 2>"
 TEST_PARSER_MAP = {
@@ -82,12 +86,34 @@ TEST_PARSER_MAP = {
     MAP_BYTES_RESPONSE_2: TEST_IMAGE_CONTENT_2,
 }
 
+# Responses for a full home discovery that visits map 123 then returns to map 0
+DISCOVERY_RPC_RESPONSES = (
+    UPDATED_STATUS_MAP_123,  # Status after switching to map 123
+    ROOM_MAPPING_DATA_MAP_123,  # Rooms for map 123
+    UPDATED_STATUS_MAP_0,  # Status after switching back to map 0
+    ROOM_MAPPING_DATA_MAP_0,  # Rooms for map 0
+)
+DISCOVERY_MQTT_RPC_RESPONSES: tuple[Any, ...] = (
+    MULTI_MAP_LIST_DATA,  # Multi maps list
+    {},  # LOAD_MULTI_MAP response for map 123
+    {},  # LOAD_MULTI_MAP response back to map 0
+)
+DISCOVERY_MAP_RPC_RESPONSES = (
+    MAP_BYTES_RESPONSE_2,  # Map bytes for 123
+    MAP_BYTES_RESPONSE_1,  # Map bytes for 0
+)
+
 
 @pytest.fixture(autouse=True)
-def no_sleep() -> Iterator[None]:
+def no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
     """Patch sleep to avoid delays in tests."""
-    with patch("roborock.devices.traits.v1.home.asyncio.sleep"):
-        yield
+
+    async def _no_sleep(*args: Any, **kwargs: Any) -> None:
+        pass
+
+    # The home trait calls asyncio.sleep through the module, so this replaces
+    # the global asyncio.sleep for the duration of each test.
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
 
 
 @pytest.fixture(name="cache")
@@ -102,45 +128,39 @@ def device_cache_fixture(cache: InMemoryCache) -> DeviceCache:
     return DeviceCache(duid="abc123", cache=cache)
 
 
-@pytest.fixture(autouse=True)
-async def status_trait(mock_rpc_channel: AsyncMock, device: RoborockDevice) -> StatusTrait:
-    """Create a StatusTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    status_trait = device.v1_properties.status
+@pytest.fixture
+def status_trait(v1_properties: PropertiesApi) -> StatusTrait:
+    """Create a StatusTrait instance with the current map set to 0."""
+    status_trait = v1_properties.status
 
     # Verify initial state
     assert status_trait.current_map is None
-    mock_rpc_channel.send_command.side_effect = [UPDATED_STATUS_MAP_0]
-    await status_trait.refresh()
+    merge_trait_values(status_trait, status_trait.converter.convert(UPDATED_STATUS_MAP_0))
     assert status_trait.current_map == 0
 
-    mock_rpc_channel.reset_mock()
     return status_trait
 
 
 @pytest.fixture
-def maps_trait(device: RoborockDevice) -> MapsTrait:
+def maps_trait(v1_properties: PropertiesApi) -> MapsTrait:
     """Create a MapsTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    return device.v1_properties.maps
+    return v1_properties.maps
 
 
 @pytest.fixture
-def map_content_trait(device: RoborockDevice) -> MapContentTrait:
+def map_content_trait(v1_properties: PropertiesApi) -> MapContentTrait:
     """Create a MapContentTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    return device.v1_properties.map_content
+    return v1_properties.map_content
 
 
 @pytest.fixture
-def rooms_trait(device: RoborockDevice) -> RoomsTrait:
+def rooms_trait(v1_properties: PropertiesApi) -> RoomsTrait:
     """Create a RoomsTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    return device.v1_properties.rooms
+    return v1_properties.rooms
 
 
 @pytest.fixture
-def mock_web_api(web_api_client: AsyncMock) -> AsyncMock:
+def mock_web_api(web_api_client: Mock) -> Mock:
     """Alias the shared web API fixture for readability in this module."""
     web_api_client.get_rooms.return_value = []
     return web_api_client
@@ -158,48 +178,37 @@ def home_trait(
     return HomeTrait(status_trait, maps_trait, map_content_trait, rooms_trait, device_cache)
 
 
-@pytest.fixture(autouse=True)
-def map_parser_fixture() -> Iterator[None]:
-    """Mock MapParser.parse to return predefined test map data."""
+def _parse_test_map(response: bytes) -> ParsedMapData:
+    """Return predefined test map data for the known map bytes."""
+    if image_content := TEST_PARSER_MAP.get(response):
+        return ParsedMapData(
+            image_content=image_content,
+            map_data=MapData(),
+        )
+    raise ValueError(f"Unexpected map bytes {response!r}")
 
-    def parse_data(response: bytes) -> ParsedMapData:
-        if image_content := TEST_PARSER_MAP.get(response):
-            return ParsedMapData(
-                image_content=image_content,
-                map_data=MagicMock(),
-            )
-        raise ValueError(f"Unexpected map bytes {response!r}")
 
-    with patch("roborock.devices.traits.v1.map_content.MapParser.parse", side_effect=parse_data):
+@pytest.fixture(autouse=True, scope="module")
+def map_parser_fixture() -> Iterator[None]:
+    """Mock MapParser.parse to return predefined test map data."""
+    with patch("roborock.devices.traits.v1.map_content.MapParser.parse", side_effect=_parse_test_map):
         yield
 
 
 async def test_discover_home_empty_cache(
     status_trait: StatusTrait,
     home_trait: HomeTrait,
-    mock_rpc_channel: AsyncMock,
-    mock_mqtt_rpc_channel: AsyncMock,
-    mock_map_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
+    mock_mqtt_rpc_channel: Mock,
+    mock_map_rpc_channel: Mock,
     device_cache: DeviceCache,
-    web_api_client: AsyncMock,
+    web_api_client: Mock,
 ) -> None:
     """Test discovering home when cache is empty."""
     # Setup mocks for the discovery process
-    mock_rpc_channel.send_command.side_effect = [
-        UPDATED_STATUS_MAP_123,  # Status after switching to map 123
-        ROOM_MAPPING_DATA_MAP_123,  # Rooms for map 123
-        UPDATED_STATUS_MAP_0,  # Status after switching back to map 0
-        ROOM_MAPPING_DATA_MAP_0,  # Rooms for map 0
-    ]
-    mock_mqtt_rpc_channel.send_command.side_effect = [
-        MULTI_MAP_LIST_DATA,  # Multi maps list
-        {},  # LOAD_MULTI_MAP response for map 123
-        {},  # LOAD_MULTI_MAP response back to map 0
-    ]
-    mock_map_rpc_channel.send_command.side_effect = [
-        MAP_BYTES_RESPONSE_2,  # Map bytes for 123
-        MAP_BYTES_RESPONSE_1,  # Map bytes for 0
-    ]
+    mock_rpc_channel.send_command.side_effect = DISCOVERY_RPC_RESPONSES
+    mock_mqtt_rpc_channel.send_command.side_effect = DISCOVERY_MQTT_RPC_RESPONSES
+    mock_map_rpc_channel.send_command.side_effect = DISCOVERY_MAP_RPC_RESPONSES
     # We have an empty home data so the room list gets loaded
     web_api_client.get_rooms.return_value = [
         HomeDataRoom(id=2362048, name="Example room 1"),
@@ -275,14 +284,14 @@ async def test_discover_home_empty_cache(
     [
         DeviceCacheData(
             home_map_info={0: CombinedMapInfo(map_flag=0, name="Dummy", rooms=[])},
-            home_map_content_base64={0: base64.b64encode(MAP_BYTES_RESPONSE_1).decode("utf-8")},
+            home_map_content_base64={0: MAP_BYTES_RESPONSE_1_B64},
         ),
     ],
 )
 async def test_discover_home_with_existing_cache(
     home_trait: HomeTrait,
-    mock_rpc_channel: AsyncMock,
-    mock_mqtt_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
+    mock_mqtt_rpc_channel: Mock,
     device_cache_data: DeviceCacheData,
     device_cache: DeviceCache,
 ) -> None:
@@ -310,16 +319,16 @@ async def test_discover_home_with_existing_cache(
 async def test_existing_home_cache_invalid_bytes(
     home_trait: HomeTrait,
     device_cache: DeviceCache,
-    mock_rpc_channel: AsyncMock,
-    mock_mqtt_rpc_channel: AsyncMock,
-    mock_map_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
+    mock_mqtt_rpc_channel: Mock,
+    mock_map_rpc_channel: Mock,
 ) -> None:
     """Test that discovery is skipped when cache already exists."""
     # Pre-populate the cache.
     cache_data = await device_cache.get()
     cache_data.home_map_info = {0: CombinedMapInfo(map_flag=0, name="Dummy", rooms=[])}
     # We override the map bytes parser to raise an exception above.
-    cache_data.home_map_content_base64 = {0: base64.b64encode(MAP_BYTES_RESPONSE_1).decode("utf-8")}
+    cache_data.home_map_content_base64 = {0: MAP_BYTES_RESPONSE_1_B64}
     await device_cache.set(cache_data)
 
     # Setup mocks for the discovery process
@@ -341,7 +350,7 @@ async def test_existing_home_cache_invalid_bytes(
             RoborockException("Invalid map bytes"),
             ParsedMapData(
                 image_content=TEST_IMAGE_CONTENT_2,
-                map_data=MagicMock(),
+                map_data=MapData(),
             ),
         ],
     ):
@@ -361,8 +370,8 @@ async def test_existing_home_cache_invalid_bytes(
 
 async def test_discover_home_no_maps(
     home_trait: HomeTrait,
-    mock_rpc_channel: AsyncMock,
-    mock_mqtt_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
+    mock_mqtt_rpc_channel: Mock,
 ) -> None:
     """Test discovery when no maps are available."""
     # Setup mock to return empty maps list
@@ -392,17 +401,15 @@ async def test_refresh_updates_current_map_cache(
     device_cache: DeviceCache,
     status_trait: StatusTrait,
     home_trait: HomeTrait,
-    mock_rpc_channel: AsyncMock,
-    mock_mqtt_rpc_channel: AsyncMock,
-    mock_map_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
+    mock_mqtt_rpc_channel: Mock,
+    mock_map_rpc_channel: Mock,
 ) -> None:
     """Test that refresh updates the cache for the current map."""
     # Pre-populate cache with some data
     cache_data = await device_cache.get()
     cache_data.home_map_info = {0: CombinedMapInfo(map_flag=0, name="Old Ground Floor", rooms=[])}
-    cache_data.home_map_content_base64 = {
-        0: base64.b64encode(MAP_BYTES_RESPONSE_2).decode()
-    }  # Pre-existing different map bytes
+    cache_data.home_map_content_base64 = {0: MAP_BYTES_RESPONSE_2_B64}  # Pre-existing different map bytes
     await device_cache.set(cache_data)
     await home_trait.discover_home()  # Load cache into trait
     # Verify initial cache state
@@ -439,49 +446,12 @@ async def test_refresh_updates_current_map_cache(
     assert home_trait.home_map_content[0].image_content == TEST_IMAGE_CONTENT_1
 
 
-async def test_current_map_data_property(
-    home_trait: HomeTrait,
-    mock_rpc_channel: AsyncMock,
-    mock_mqtt_rpc_channel: AsyncMock,
-    mock_map_rpc_channel: AsyncMock,
-) -> None:
-    """Test current_map_data property returns correct data."""
-    # Setup discovery
-    mock_rpc_channel.send_command.side_effect = [
-        UPDATED_STATUS_MAP_123,  # Status after switching to map 123
-        ROOM_MAPPING_DATA_MAP_123,  # Rooms for map 123
-        UPDATED_STATUS_MAP_0,  # Status after switching back to map 0
-        ROOM_MAPPING_DATA_MAP_0,  # Rooms for map 0
-    ]
-    mock_mqtt_rpc_channel.send_command.side_effect = [
-        MULTI_MAP_LIST_DATA,  # Multi maps list
-        {},  # LOAD_MULTI_MAP response for map 123
-        {},  # LOAD_MULTI_MAP response back to map 0
-    ]
-    mock_map_rpc_channel.send_command.side_effect = [
-        MAP_BYTES_RESPONSE_2,  # Map bytes for 123
-        MAP_BYTES_RESPONSE_1,  # Map bytes for 0
-    ]
-
-    await home_trait.discover_home()
-
-    # Test current map data (should be map 0)
-    current_data = home_trait.current_map_data
-    assert current_data is not None
-    assert current_data.map_flag == 0
-    assert current_data.name == "Ground Floor"
-
-    # Test when no cache exists
-    home_trait._home_map_info = None
-    assert home_trait.current_map_data is None
-
-
 async def test_discover_home_device_busy_cleaning(
     status_trait: StatusTrait,
     home_trait: HomeTrait,
-    mock_rpc_channel: AsyncMock,
-    mock_mqtt_rpc_channel: AsyncMock,
-    mock_map_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
+    mock_mqtt_rpc_channel: Mock,
+    mock_map_rpc_channel: Mock,
     device_cache: DeviceCache,
 ) -> None:
     """Test that discovery raises RoborockDeviceBusy when device is cleaning.
@@ -547,21 +517,9 @@ async def test_discover_home_device_busy_cleaning(
     status_trait.state = RoborockStateCode.idle
 
     # Setup mocks for the discovery process
-    mock_rpc_channel.send_command.side_effect = [
-        UPDATED_STATUS_MAP_123,  # Status after switching to map 123
-        ROOM_MAPPING_DATA_MAP_123,  # Rooms for map 123
-        UPDATED_STATUS_MAP_0,  # Status after switching back to map 0
-        ROOM_MAPPING_DATA_MAP_0,  # Rooms for map 0
-    ]
-    mock_mqtt_rpc_channel.send_command.side_effect = [
-        MULTI_MAP_LIST_DATA,  # Multi maps list
-        {},  # LOAD_MULTI_MAP response for map 123
-        {},  # LOAD_MULTI_MAP response back to map 0
-    ]
-    mock_map_rpc_channel.send_command.side_effect = [
-        MAP_BYTES_RESPONSE_2,  # Map bytes for 123
-        MAP_BYTES_RESPONSE_1,  # Map bytes for 0
-    ]
+    mock_rpc_channel.send_command.side_effect = DISCOVERY_RPC_RESPONSES
+    mock_mqtt_rpc_channel.send_command.side_effect = DISCOVERY_MQTT_RPC_RESPONSES
+    mock_map_rpc_channel.send_command.side_effect = DISCOVERY_MAP_RPC_RESPONSES
 
     # Refreshing should now perform discovery successfully
     await home_trait.refresh()
@@ -587,9 +545,9 @@ async def test_discover_home_device_busy_cleaning(
 async def test_refresh_falls_back_when_map_switch_action_locked(
     status_trait: StatusTrait,
     home_trait: HomeTrait,
-    mock_rpc_channel: AsyncMock,
-    mock_mqtt_rpc_channel: AsyncMock,
-    mock_map_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
+    mock_mqtt_rpc_channel: Mock,
+    mock_map_rpc_channel: Mock,
     device_cache: DeviceCache,
 ) -> None:
     """Test that refresh falls back to current map when map switching is locked."""
@@ -630,9 +588,9 @@ async def test_refresh_falls_back_when_map_switch_action_locked(
 
 async def test_single_map_no_switching(
     home_trait: HomeTrait,
-    mock_rpc_channel: AsyncMock,
-    mock_mqtt_rpc_channel: AsyncMock,
-    mock_map_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
+    mock_mqtt_rpc_channel: Mock,
+    mock_map_rpc_channel: Mock,
 ) -> None:
     """Test that single map discovery doesn't trigger map switching."""
     mock_rpc_channel.send_command.side_effect = [
@@ -654,12 +612,9 @@ async def test_single_map_no_switching(
     assert home_trait.home_map_content.keys() == {0}
 
     # Verify no LOAD_MULTI_MAP commands were sent (no map switching)
-    load_map_calls = [
-        call
-        for call in mock_mqtt_rpc_channel.send_command.call_args_list
-        if call[1].get("command") == RoborockCommand.LOAD_MULTI_MAP
-    ]
-    assert len(load_map_calls) == 0
+    assert not any(
+        call.args[0] == RoborockCommand.LOAD_MULTI_MAP for call in mock_mqtt_rpc_channel.send_command.call_args_list
+    )
 
 
 async def test_refresh_map_info_prefers_map_info_names_and_adds_missing_rooms(
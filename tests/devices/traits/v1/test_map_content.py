@@ -1,32 +1,32 @@
 """Tests for the MapContentTrait."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import Mock, patch
 
 import pytest
+from vacuum_map_parser_base.map_data import MapData
 
-from roborock.devices.device import RoborockDevice
+from roborock.devices.traits.v1 import PropertiesApi
 from roborock.devices.traits.v1.map_content import MapContentTrait
 from roborock.map.map_parser import ParsedMapData
 from roborock.roborock_typing import RoborockCommand
 
 
 @pytest.fixture
-def map_content_trait(device: RoborockDevice) -> MapContentTrait:
+def map_content_trait(v1_properties: PropertiesApi) -> MapContentTrait:
     """Create a MapContentTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    return device.v1_properties.map_content
+    return v1_properties.map_content
 
 
 async def test_refresh_map_content_trait(
     map_content_trait: MapContentTrait,
-    mock_map_rpc_channel: AsyncMock,
+    mock_map_rpc_channel: Mock,
 ) -> None:
     """Test successfully getting and parsing map content."""
     map_data = b"dummy_map_bytes"
     mock_map_rpc_channel.send_command.return_value = map_data
     mock_parsed_data = ParsedMapData(
         image_content=b"dummy_image_content",
-        map_data=MagicMock(),
+        map_data=MapData(),
     )
 
     with patch("roborock.devices.traits.v1.map_content.MapParser.parse", return_value=mock_parsed_data) as mock_parse:
@@ -1,10 +1,10 @@
 """Tests for the Maps related functionality."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import Mock
 
 import pytest
 
-from roborock.devices.device import RoborockDevice
+from roborock.devices.traits.v1 import PropertiesApi
 from roborock.devices.traits.v1.maps import MapsTrait
 from roborock.devices.traits.v1.status import StatusTrait
 from roborock.roborock_typing import RoborockCommand
@@ -42,23 +42,21 @@ MULTI_MAP_LIST_DATA = [
 
 
 @pytest.fixture
-def status_trait(device: RoborockDevice) -> StatusTrait:
+def status_trait(v1_properties: PropertiesApi) -> StatusTrait:
     """Create a MapsTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    return device.v1_properties.status
+    return v1_properties.status
 
 
 @pytest.fixture
-def maps_trait(device: RoborockDevice) -> MapsTrait:
+def maps_trait(v1_properties: PropertiesApi) -> MapsTrait:
     """Create a MapsTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    return device.v1_properties.maps
+    return v1_properties.maps
 
 
 async def test_refresh_maps_trait(
     maps_trait: MapsTrait,
-    mock_rpc_channel: AsyncMock,
-    mock_mqtt_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
+    mock_mqtt_rpc_channel: Mock,
     status_trait: StatusTrait,
 ) -> None:
     """Test successfully getting multi maps list."""
@@ -110,11 +108,10 @@ async def test_refresh_maps_trait(
 async def test_set_current_map(
     status_trait: StatusTrait,
     maps_trait: MapsTrait,
-    mock_rpc_channel: AsyncMock,
-    mock_mqtt_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
+    mock_mqtt_rpc_channel: Mock,
 ) -> None:
     """Test successfully setting the current map."""
-    assert hasattr(maps_trait, "mqtt_rpc_channel")
     mock_rpc_channel.send_command.side_effect = [
         mock_data.STATUS,  # Initial status fetch
         UPDATED_STATUS,  # Response for refreshing status
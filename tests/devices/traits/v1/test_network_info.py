@@ -1,12 +1,12 @@
 """Tests for the NetworkInfoTrait class."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import Mock
 
 import pytest
 
 from roborock.data import NetworkInfo
 from roborock.devices.cache import Cache, DeviceCache
-from roborock.devices.device import RoborockDevice
+from roborock.devices.traits.v1 import PropertiesApi
 from roborock.devices.traits.v1.network_info import NetworkInfoTrait
 from roborock.roborock_typing import RoborockCommand
 from tests.mock_data import NETWORK_INFO
@@ -15,14 +15,13 @@ DEVICE_UID = "abc123"
 
 
 @pytest.fixture
-def network_info_trait(device: RoborockDevice) -> NetworkInfoTrait:
+def network_info_trait(v1_properties: PropertiesApi) -> NetworkInfoTrait:
     """Create a NetworkInfoTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    return device.v1_properties.network_info
+    return v1_properties.network_info
 
 
 async def test_network_info_from_cache(
-    network_info_trait: NetworkInfoTrait, roborock_cache: Cache, mock_rpc_channel: AsyncMock
+    network_info_trait: NetworkInfoTrait, roborock_cache: Cache, mock_rpc_channel: Mock
 ) -> None:
     """Test that network info is read from the cache."""
     device_cache = DeviceCache(DEVICE_UID, roborock_cache)
@@ -40,7 +39,7 @@ async def test_network_info_from_cache(
 
 
 async def test_network_info_from_device(
-    network_info_trait: NetworkInfoTrait, roborock_cache: Cache, mock_rpc_channel: AsyncMock
+    network_info_trait: NetworkInfoTrait, roborock_cache: Cache, mock_rpc_channel: Mock
 ) -> None:
     """Test that network info is fetched from the device when not in cache."""
     mock_rpc_channel.send_command.return_value = {
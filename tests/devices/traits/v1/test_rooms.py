@@ -2,30 +2,28 @@
 
 from copy import deepcopy
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import Mock
 
 import pytest
 
 from roborock.data.containers import HomeData, HomeDataRoom, NamedRoomMapping
-from roborock.devices.device import RoborockDevice
+from roborock.devices.traits.v1 import PropertiesApi
 from roborock.devices.traits.v1.rooms import RoomsTrait
 from roborock.devices.traits.v1.status import StatusTrait
 from roborock.roborock_typing import RoborockCommand
-from tests.devices.traits.v1.fixtures import HOME_DATA
+from tests.devices.traits.v1.conftest import HOME_DATA
 
 
 @pytest.fixture
-def status_trait(device: RoborockDevice) -> StatusTrait:
+def status_trait(v1_properties: PropertiesApi) -> StatusTrait:
     """Create a StatusTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    return device.v1_properties.status
+    return v1_properties.status
 
 
 @pytest.fixture
-def rooms_trait(device: RoborockDevice) -> RoomsTrait:
+def rooms_trait(v1_properties: PropertiesApi) -> RoomsTrait:
     """Create a RoomsTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    return device.v1_properties.rooms
+    return v1_properties.rooms
 
 
 # Rooms from mock_data.HOME_DATA
@@ -41,12 +39,12 @@ def rooms_trait(device: RoborockDevice) -> RoomsTrait:
 )
 async def test_refresh_rooms_trait(
     rooms_trait: RoomsTrait,
-    mock_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
     room_mapping_data: list[Any],
 ) -> None:
     """Test successfully getting room mapping."""
     # Setup mock to return the sample room mapping
-    mock_rpc_channel.send_command.side_effect = [room_mapping_data]
+    mock_rpc_channel.send_command.return_value = room_mapping_data
     # Before refresh, rooms should be empty
     assert not rooms_trait.rooms
 
@@ -77,8 +75,8 @@ async def test_refresh_rooms_trait(
 
 async def test_refresh_unknown_room_names_overwrites_home_data(
     rooms_trait: RoomsTrait,
-    web_api_client: AsyncMock,
-    mock_rpc_channel: AsyncMock,
+    web_api_client: Mock,
+    mock_rpc_channel: Mock,
 ) -> None:
     """Test web rooms are used to refresh home data for missing iot ids."""
     web_api_client.get_rooms.return_value = [
@@ -89,7 +87,7 @@ async def test_refresh_unknown_room_names_overwrites_home_data(
     ]
 
     room_mapping_data = [[16, "2362048"], [17, "9999999"]]
-    mock_rpc_channel.send_command.side_effect = [room_mapping_data]
+    mock_rpc_channel.send_command.return_value = room_mapping_data
 
     await rooms_trait.refresh()
 
@@ -104,8 +102,8 @@ async def test_refresh_unknown_room_names_overwrites_home_data(
 
 async def test_refresh_unknown_room_names_web_api_called_once(
     rooms_trait: RoomsTrait,
-    web_api_client: AsyncMock,
-    mock_rpc_channel: AsyncMock,
+    web_api_client: Mock,
+    mock_rpc_channel: Mock,
 ) -> None:
     """Test unknown room IDs trigger one web lookup per iot_id."""
     web_api_client.get_rooms.return_value = [
@@ -127,8 +125,8 @@ async def test_refresh_unknown_room_names_web_api_called_once(
 
 async def test_refresh_unknown_room_names_unresolved_uses_room_fallback(
     rooms_trait: RoomsTrait,
-    web_api_client: AsyncMock,
-    mock_rpc_channel: AsyncMock,
+    web_api_client: Mock,
+    mock_rpc_channel: Mock,
 ) -> None:
     """Test unresolved unknown names use Room fallback in RoomsTrait."""
     web_api_client.get_rooms.return_value = []
@@ -149,8 +147,8 @@ async def test_refresh_unknown_room_names_unresolved_uses_room_fallback(
 
 async def test_refresh_unknown_room_names_called_again_for_new_unknown_room(
     rooms_trait: RoomsTrait,
-    web_api_client: AsyncMock,
-    mock_rpc_channel: AsyncMock,
+    web_api_client: Mock,
+    mock_rpc_channel: Mock,
 ) -> None:
     """Test get_rooms is called again when a new unknown room appears."""
     room_mapping_data_1 = [[16, "9999601"]]
@@ -170,8 +168,8 @@ async def test_refresh_unknown_room_names_called_again_for_new_unknown_room(
 
 async def test_refresh_unknown_room_names_called_again_for_new_unknown_iot_id_same_segment(
     rooms_trait: RoomsTrait,
-    web_api_client: AsyncMock,
-    mock_rpc_channel: AsyncMock,
+    web_api_client: Mock,
+    mock_rpc_channel: Mock,
 ) -> None:
     """Test get_rooms is called again for a new unknown iot_id on the same segment."""
     room_mapping_data_1 = [[16, "9999501"]]
@@ -187,12 +185,12 @@ async def test_refresh_unknown_room_names_called_again_for_new_unknown_iot_id_sa
 
 async def test_refresh_unknown_room_names_failure_falls_back_to_room_segment_id(
     rooms_trait: RoomsTrait,
-    web_api_client: AsyncMock,
-    mock_rpc_channel: AsyncMock,
+    web_api_client: Mock,
+    mock_rpc_channel: Mock,
 ) -> None:
     """Test get_rooms failure gracefully falls back to Room {segment_id}."""
     room_mapping_data = [[16, "9999401"]]
-    mock_rpc_channel.send_command.side_effect = [room_mapping_data]
+    mock_rpc_channel.send_command.return_value = room_mapping_data
     web_api_client.get_rooms.side_effect = Exception("API error")
 
     await rooms_trait.refresh()
@@ -213,8 +211,8 @@ def _build_shared_home_data() -> HomeData:
 async def test_refresh_shared_room_names_use_shared_device_rooms(
     rooms_trait: RoomsTrait,
     trait_home_data: HomeData,
-    web_api_client: AsyncMock,
-    mock_rpc_channel: AsyncMock,
+    web_api_client: Mock,
+    mock_rpc_channel: Mock,
 ) -> None:
     """Test shared devices resolve room names via the shared-device room list."""
     assert trait_home_data.received_devices
@@ -224,7 +222,7 @@ async def test_refresh_shared_room_names_use_shared_device_rooms(
         HomeDataRoom(id=9999999, name="Office"),
     ]
     room_mapping_data = [[16, "2362048"], [17, "9999999"]]
-    mock_rpc_channel.send_command.side_effect = [room_mapping_data]
+    mock_rpc_channel.send_command.return_value = room_mapping_data
 
     await rooms_trait.refresh()
 
@@ -1,13 +1,13 @@
 """Tests for the DockSummaryTrait class."""
 
-from unittest.mock import AsyncMock, call
+from unittest.mock import Mock
 
 import pytest
 
 from roborock.data.v1.v1_code_mappings import (
     RoborockDockTypeCode,
 )
-from roborock.devices.device import RoborockDevice
+from roborock.devices.traits.v1 import PropertiesApi
 from roborock.devices.traits.v1.smart_wash_params import SmartWashParamsTrait
 from roborock.roborock_typing import RoborockCommand
 
@@ -16,12 +16,11 @@ SMART_WASH_DATA = [{"smart_wash": 5, "wash_interval": 6}]
 
 @pytest.fixture(name="smart_wash_params")
 def smart_wash_params_trait(
-    device: RoborockDevice,
+    v1_properties: PropertiesApi,
     discover_features_fixture: None,
 ) -> SmartWashParamsTrait | None:
     """Create a SmartWashParamsTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    return device.v1_properties.smart_wash_params
+    return v1_properties.smart_wash_params
 
 
 @pytest.mark.parametrize(
@@ -36,26 +35,20 @@ def smart_wash_params_trait(
 )
 async def test_smart_wash_available(
     smart_wash_params: SmartWashParamsTrait | None,
-    mock_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
     dock_type_code: RoborockDockTypeCode,
 ) -> None:
     """Test successfully refreshing the smart wash params."""
     assert smart_wash_params is not None
 
     # Setup mock to return the sample clean summary and clean record
-    mock_rpc_channel.send_command.side_effect = [
-        SMART_WASH_DATA,
-    ]
+    mock_rpc_channel.send_command.return_value = SMART_WASH_DATA
 
     # Call the method
     await smart_wash_params.refresh()
 
     # Verify the RPC calls were made correctly
-    mock_rpc_channel.send_command.assert_has_calls(
-        [
-            call(RoborockCommand.GET_SMART_WASH_PARAMS),
-        ]
-    )
+    mock_rpc_channel.send_command.assert_called_once_with(RoborockCommand.GET_SMART_WASH_PARAMS)
 
     # Verify the summary object contains the traits
     assert smart_wash_params.smart_wash == 5
@@ -69,7 +62,7 @@ async def test_smart_wash_available(
         (RoborockDockTypeCode.no_dock),
     ],
 )
-async def test_unsupported_smart_wash_params(
+def test_unsupported_smart_wash_params(
     smart_wash_params: SmartWashParamsTrait | None, dock_type_code: RoborockDockTypeCode
 ) -> None:
     """Test successfully refreshing the dock summary."""
@@ -2,7 +2,7 @@
 
 import asyncio
 from typing import cast
-from unittest.mock import AsyncMock
+from unittest.mock import Mock
 
 import pytest
 
@@ -11,7 +11,7 @@ from roborock.data.v1 import (
     RoborockStateCode,
 )
 from roborock.device_features import DeviceFeatures
-from roborock.devices.device import RoborockDevice
+from roborock.devices.traits.v1 import PropertiesApi
 from roborock.devices.traits.v1.device_features import DeviceFeaturesTrait
 from roborock.devices.traits.v1.status import StatusTrait
 from roborock.exceptions import RoborockException, RoborockParsingException
@@ -22,13 +22,12 @@ from tests.mock_data import STATUS
 
 
 @pytest.fixture
-def status_trait(device: RoborockDevice) -> StatusTrait:
+def status_trait(v1_properties: PropertiesApi) -> StatusTrait:
     """Create a StatusTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    return device.v1_properties.status
+    return v1_properties.status
 
 
-async def test_refresh_status(status_trait: StatusTrait, mock_rpc_channel: AsyncMock) -> None:
+async def test_refresh_status(status_trait: StatusTrait, mock_rpc_channel: Mock) -> None:
     """Test successfully refreshing status."""
     mock_rpc_channel.send_command.return_value = [STATUS]
 
@@ -42,7 +41,7 @@ async def test_refresh_status(status_trait: StatusTrait, mock_rpc_channel: Async
     mock_rpc_channel.send_command.assert_called_once_with(RoborockCommand.GET_STATUS)
 
 
-async def test_refresh_status_dict_response(status_trait: StatusTrait, mock_rpc_channel: AsyncMock) -> None:
+async def test_refresh_status_dict_response(status_trait: StatusTrait, mock_rpc_channel: Mock) -> None:
     """Test refreshing status when response is a dict instead of list."""
     mock_rpc_channel.send_command.return_value = STATUS
 
@@ -53,7 +52,7 @@ async def test_refresh_status_dict_response(status_trait: StatusTrait, mock_rpc_
     mock_rpc_channel.send_command.assert_called_once_with(RoborockCommand.GET_STATUS)
 
 
-async def test_refresh_status_propagates_exception(status_trait: StatusTrait, mock_rpc_channel: AsyncMock) -> None:
+async def test_refresh_status_propagates_exception(status_trait: StatusTrait, mock_rpc_channel: Mock) -> None:
     """Test that exceptions from RPC channel are propagated."""
     mock_rpc_channel.send_command.side_effect = RoborockException("Communication error")
 
@@ -61,7 +60,7 @@ async def test_refresh_status_propagates_exception(status_trait: StatusTrait, mo
         await status_trait.refresh()
 
 
-async def test_refresh_status_invalid_format(status_trait: StatusTrait, mock_rpc_channel: AsyncMock) -> None:
+async def test_refresh_status_invalid_format(status_trait: StatusTrait, mock_rpc_channel: Mock) -> None:
     """Test that invalid response format raises RoborockParsingException."""
     mock_rpc_channel.send_command.return_value = "invalid"
 
@@ -1,6 +1,6 @@
 """Tests for the WashTowelModeTrait class."""
 
-from unittest.mock import AsyncMock, call
+from unittest.mock import Mock
 
 import pytest
 
@@ -8,7 +8,7 @@ from roborock.data import (
     RoborockDockTypeCode,
     WashTowelModes,
 )
-from roborock.devices.device import RoborockDevice
+from roborock.devices.traits.v1 import PropertiesApi
 from roborock.devices.traits.v1.wash_towel_mode import WashTowelModeTrait
 from roborock.roborock_typing import RoborockCommand
 
@@ -17,12 +17,11 @@ WASH_TOWEL_MODE_DATA = {"wash_mode": WashTowelModes.SMART.code}
 
 @pytest.fixture(name="wash_towel_mode")
 def wash_towel_mode_trait(
-    device: RoborockDevice,
+    v1_properties: PropertiesApi,
     discover_features_fixture: None,
 ) -> WashTowelModeTrait | None:
     """Create a WashTowelModeTrait instance with mocked dependencies."""
-    assert device.v1_properties
-    return device.v1_properties.wash_towel_mode
+    return v1_properties.wash_towel_mode
 
 
 @pytest.mark.parametrize(
@@ -37,23 +36,17 @@ def wash_towel_mode_trait(
 )
 async def test_wash_towel_mode_available(
     wash_towel_mode: WashTowelModeTrait,
-    mock_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
     dock_type_code: RoborockDockTypeCode,
 ) -> None:
     """Test successfully refreshing the wash towel mode."""
     assert wash_towel_mode is not None
 
-    mock_rpc_channel.send_command.side_effect = [
-        WASH_TOWEL_MODE_DATA,
-    ]
+    mock_rpc_channel.send_command.return_value = WASH_TOWEL_MODE_DATA
 
     await wash_towel_mode.refresh()
 
-    mock_rpc_channel.send_command.assert_has_calls(
-        [
-            call(RoborockCommand.GET_WASH_TOWEL_MODE),
-        ]
-    )
+    mock_rpc_channel.send_command.assert_called_once_with(RoborockCommand.GET_WASH_TOWEL_MODE)
 
     assert wash_towel_mode.wash_mode == WashTowelModes.SMART
 
@@ -65,7 +58,7 @@ async def test_wash_towel_mode_available(
         (RoborockDockTypeCode.no_dock),
     ],
 )
-async def test_unsupported_wash_towel_mode(
+def test_unsupported_wash_towel_mode(
     wash_towel_mode: WashTowelModeTrait | None, dock_type_code: RoborockDockTypeCode
 ) -> None:
     """Test that the trait is not available for unsupported dock types."""
@@ -85,7 +78,7 @@ async def test_unsupported_wash_towel_mode(
 )
 async def test_set_wash_towel_mode(
     wash_towel_mode: WashTowelModeTrait,
-    mock_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
     wash_mode: WashTowelModes,
     dock_type_code: RoborockDockTypeCode,
 ) -> None:
@@ -105,7 +98,7 @@ async def test_set_wash_towel_mode(
 )
 async def test_start_wash(
     wash_towel_mode: WashTowelModeTrait,
-    mock_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
     dock_type_code: RoborockDockTypeCode,
 ) -> None:
     """Test starting the wash."""
@@ -122,7 +115,7 @@ async def test_start_wash(
 )
 async def test_stop_wash(
     wash_towel_mode: WashTowelModeTrait,
-    mock_rpc_channel: AsyncMock,
+    mock_rpc_channel: Mock,
     dock_type_code: RoborockDockTypeCode,
 ) -> None:
     """Test stopping the wash."""
@@ -181,7 +174,7 @@ async def test_stop_wash(
         ),
     ],
 )
-async def test_wash_towel_mode_options(
+def test_wash_towel_mode_options(
     wash_towel_mode: WashTowelModeTrait,
     dock_type_code: RoborockDockTypeCode,
     is_super_deep_wash_supported: bool,
@@ -328,6 +328,7 @@ async def test_v1_device(
 
 
 async def test_l01_device(
+    fast_local_timeout: None,
     mock_rest: Any,
     push_mqtt_response: Callable[[bytes], None],
     local_response_queue: asyncio.Queue[bytes],
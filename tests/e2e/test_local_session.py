@@ -1,13 +1,14 @@
 """End-to-end tests for LocalChannel using fake sockets."""
 
 import asyncio
+import struct
 from collections.abc import AsyncGenerator
 
 import pytest
 import syrupy
 
 from roborock.devices.transport.local_channel import LocalChannel
-from roborock.protocol import MessageParser, create_local_decoder
+from roborock.protocol import Decoder, MessageParser, create_local_decoder
 from roborock.protocols.v1_protocol import LocalProtocolVersion
 from roborock.roborock_message import RoborockMessage, RoborockMessageProtocol
 from tests.fixtures.logging import CapturedRequestLog
@@ -18,6 +19,11 @@ TEST_HOST = "192.168.1.100"
 TEST_DEVICE_UID = "test_device_uid"
 TEST_RANDOM = 23
 
+# Protocol is at offset 19 (2 bytes)
+# Prefix(4) + Version(3) + Seq(4) + Random(4) + Timestamp(4) = 19
+_PROTOCOL = struct.Struct(">H")
+_PROTOCOL_OFFSET = 19
+
 
 @pytest.fixture(name="local_channel")
 async def local_channel_fixture(mock_async_create_local_connection: None) -> AsyncGenerator[LocalChannel, None]:
@@ -45,6 +51,19 @@ def build_raw_response(
     return MessageParser.build(message, local_key=LOCAL_KEY, connect_nonce=connect_nonce, ack_nonce=ack_nonce)
 
 
+def request_protocol(request_bytes: bytes) -> int:
+    """Read the protocol field from a raw encoded request."""
+    assert len(request_bytes) >= _PROTOCOL_OFFSET + _PROTOCOL.size
+    return _PROTOCOL.unpack_from(request_bytes, _PROTOCOL_OFFSET)[0]
+
+
+def decode_one(decoder: Decoder, request_bytes: bytes) -> RoborockMessage:
+    """Decode a raw request that is expected to contain exactly one message."""
+    msgs = decoder(request_bytes)
+    assert len(msgs) == 1
+    return msgs[0]
+
+
 async def test_connect(
     local_channel: LocalChannel,
     local_response_queue: asyncio.Queue[bytes],
@@ -66,11 +85,7 @@ async def test_connect(
     # Note: We cannot use create_local_decoder here because HELLO_REQUEST has payload=None
     # which causes MessageParser to fail parsing. For now we verify the raw bytes.
 
-    # Protocol is at offset 19 (2 bytes)
-    # Prefix(4) + Version(3) + Seq(4) + Random(4) + Timestamp(4) = 19
-    assert len(request_bytes) >= 21
-    protocol_bytes = request_bytes[19:21]
-    assert int.from_bytes(protocol_bytes, "big") == RoborockMessageProtocol.HELLO_REQUEST
+    assert request_protocol(request_bytes) == RoborockMessageProtocol.HELLO_REQUEST
 
     assert snapshot == log
 
@@ -115,11 +130,10 @@ async def test_send_command(
 
     # Decode request
     decoder = create_local_decoder(local_key=LOCAL_KEY)
-    msgs = list(decoder(request_bytes))
-    assert len(msgs) == 1
-    assert msgs[0].protocol == RoborockMessageProtocol.RPC_REQUEST
-    assert msgs[0].payload == b'{"method":"get_status"}'
-    assert msgs[0].version == LocalProtocolVersion.V1.value.encode()
+    request = decode_one(decoder, request_bytes)
+    assert request.protocol == RoborockMessageProtocol.RPC_REQUEST
+    assert request.payload == b'{"method":"get_status"}'
+    assert request.version == LocalProtocolVersion.V1.value.encode()
 
     # Verify response received by subscriber
     await subscriber.wait()
@@ -135,6 +149,7 @@ async def test_send_command(
 
 
 async def test_l01_session(
+    fast_local_timeout: None,
     local_channel: LocalChannel,
     local_response_queue: asyncio.Queue[bytes],
     local_received_requests: asyncio.Queue[bytes],
@@ -143,8 +158,8 @@ async def test_l01_session(
 ) -> None:
     """Test connecting to a device that speaks the L01 protocol.
 
-    Note that this test currently has a delay because the actual local client
-    will delay before retrying with L01 after a failed 1.0 attempt. This should
+    Note that the actual local client waits for the 1.0 attempt to time out
+    before retrying with L01, so this test shortens that timeout. This should
     also be improved in the actual client itself, but likely requires a closer
     look at the actual device response in that scenario or moving to a serial
     request/response behavior rather than publish/subscribe.
@@ -173,19 +188,11 @@ async def test_l01_session(
 
     # Verify 1.0 HELLO request
     request_bytes = await local_received_requests.get()
-    # Protocol is at offset 19 (2 bytes)
-    # Prefix(4) + Version(3) + Seq(4) + Random(4) + Timestamp(4) = 19
-    assert len(request_bytes) >= 21
-    protocol_bytes = request_bytes[19:21]
-    assert int.from_bytes(protocol_bytes, "big") == RoborockMessageProtocol.HELLO_REQUEST
+    assert request_protocol(request_bytes) == RoborockMessageProtocol.HELLO_REQUEST
 
     # Verify L01 HELLO request
     request_bytes = await local_received_requests.get()
-    # Protocol is at offset 19 (2 bytes)
-    # Prefix(4) + Version(3) + Seq(4) + Random(4) + Timestamp(4) = 19
-    assert len(request_bytes) >= 21
-    protocol_bytes = request_bytes[19:21]
-    assert int.from_bytes(protocol_bytes, "big") == RoborockMessageProtocol.HELLO_REQUEST
+    assert request_protocol(request_bytes) == RoborockMessageProtocol.HELLO_REQUEST
 
     assert local_received_requests.empty()
 
@@ -223,11 +230,10 @@ async def test_l01_session(
     # Verify request received by the server
     request_bytes = await local_received_requests.get()
     decoder = create_local_decoder(local_key=LOCAL_KEY, connect_nonce=connect_nonce, ack_nonce=TEST_RANDOM)
-    msgs = list(decoder(request_bytes))
-    assert len(msgs) == 1
-    assert msgs[0].protocol == RoborockMessageProtocol.RPC_REQUEST
-    assert msgs[0].payload == b'{"method":"get_status"}'
-    assert msgs[0].version == LocalProtocolVersion.L01.value.encode()
+    request = decode_one(decoder, request_bytes)
+    assert request.protocol == RoborockMessageProtocol.RPC_REQUEST
+    assert request.payload == b'{"method":"get_status"}'
+    assert request.version == LocalProtocolVersion.L01.value.encode()
 
     # Verify fake response published by the server, received by subscriber
     await subscriber.wait()
@@ -1,3 +1,4 @@
+from collections import deque
 from collections.abc import Callable
 from unittest.mock import AsyncMock, MagicMock
 
@@ -7,13 +8,17 @@ from roborock.roborock_message import RoborockMessage
 
 
 class FakeChannel:
-    """A fake channel that handles publish and subscribe calls."""
+    """A fake channel that handles publish and subscribe calls.
+
+    Responses appended to `response_queue` are delivered to subscribers in FIFO
+    order, one per published message.
+    """
 
     def __init__(self):
         """Initialize the fake channel."""
         self.subscribers: list[Callable[[RoborockMessage], None]] = []
         self.published_messages: list[RoborockMessage] = []
-        self.response_queue: list[RoborockMessage] = []
+        self.response_queue: deque[RoborockMessage] = deque()
         self._is_connected = False
         self.publish_side_effect: Exception | None = None
         self.publish = AsyncMock(side_effect=self._publish)
@@ -42,7 +47,7 @@ class FakeChannel:
             raise self.publish_side_effect
         # When a message is published, simulate a response
         if self.response_queue:
-            response = self.response_queue.pop(0)
+            response = self.response_queue.popleft()
             # Give a chance for the subscriber to be registered
             for subscriber in list(self.subscribers):
                 subscriber(response)
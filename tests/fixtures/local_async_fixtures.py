@@ -29,6 +29,17 @@ def response_queue_fixture() -> Generator[asyncio.Queue[bytes], None, None]:
         warnings.warn("Some enqueued local device responses were not consumed during the test")
 
 
+@pytest.fixture(name="fast_local_timeout")
+def fast_local_timeout_fixture() -> Generator[None, None, None]:
+    """Fixture to shorten how long the local channel waits for a response.
+
+    This is useful for tests that exercise protocol fallback, where the client
+    waits for the first HELLO attempt to time out before trying the next version.
+    """
+    with patch("roborock.devices.transport.local_channel._TIMEOUT", 0.5):
+        yield
+
+
 @pytest.fixture(name="local_async_request_handler")
 def local_request_handler_fixture(
     local_received_requests: asyncio.Queue[bytes], local_response_queue: asyncio.Queue[bytes]
@@ -149,16 +149,20 @@ SAROS_10R_DEVICE_DATA = DEVICES["home_data_device_saros_10r.json"]
 
 # All testdata devices joined with their matching product (keyed by device filename).
 # Devices whose productId has no corresponding product file are omitted.
-_PRODUCTS_BY_ID: dict[str, HomeDataProduct] = {
+PRODUCTS_BY_ID: dict[str, HomeDataProduct] = {
     p.id: p for p in (HomeDataProduct.from_dict(v) for v in PRODUCTS.values())
 }
-_DEVICES_BY_FILENAME: dict[str, HomeDataDevice] = {
+DEVICES_BY_FILENAME: dict[str, HomeDataDevice] = {
     filename: HomeDataDevice.from_dict(device_data) for filename, device_data in DEVICES.items()
 }
+# Parsed testdata devices that use the V1 protocol (keyed by device filename).
+V1_DEVICES: dict[str, HomeDataDevice] = {
+    filename: device for filename, device in DEVICES_BY_FILENAME.items() if device.pv == "1.0"
+}
 DEVICE_PRODUCT_PAIRS: dict[str, tuple[HomeDataDevice, HomeDataProduct]] = {
     filename: (device, product)
-    for filename, device in _DEVICES_BY_FILENAME.items()
-    if (product := _PRODUCTS_BY_ID.get(device.product_id)) is not None
+    for filename, device in DEVICES_BY_FILENAME.items()
+    if (product := PRODUCTS_BY_ID.get(device.product_id)) is not None
 }
 
 